@@ -7,6 +7,29 @@ Uses the exact method discovered by the user:
 - Works with truncation at ~48048 Hz
 """
 
+import re
+import sys
+from fractions import Fraction
+from functools import lru_cache
+
+# HH:MM:SS:FF, ';' accepted as separator for drop-frame notation
+_TC_RE = re.compile(r'^(\d{1,2})[:;](\d{1,2})[:;](\d{1,2})[:;](\d{1,2})$')
+
+@lru_cache(maxsize=None)
+def _exact(value):
+    """
+    Exact (numerator, denominator) for a decimal constant
+    (23.976 -> (2997, 125)), converted once per distinct value
+    """
+    frac = Fraction(str(value))
+    return frac.numerator, frac.denominator
+
+# Default 23.976 fps / 2004.005263 constants, folded once:
+# TimeReference = (whole seconds * _FR_NUM + frames * _FR_DEN) * _SPF_NUM // _FB_DIV
+_FR_NUM, _FR_DEN = _exact(23.976)
+_SPF_NUM, _SPF_DEN = _exact(2004.005263)
+_FB_DIV = _FR_DEN * _SPF_DEN
+
 def calculate_timereference_frame_based(hours, minutes, seconds, frames, 
                                        frame_rate=23.976, 
                                        samples_per_frame=2004.005263):
@@ -24,30 +47,42 @@ def calculate_timereference_frame_based(hours, minutes, seconds, frames,
     Returns:
         TimeReference in samples
     """
-    # Calculate total frames
-    total_frames = (hours * 60 * 60 * frame_rate) + \
-                   (minutes * 60 * frame_rate) + \
-                   (seconds * frame_rate) + \
-                   frames
+    # Integer-only arithmetic: keep the decimal constants as exact
+    # rationals so large timecodes don't pick up floating point error
+    if frame_rate == 23.976 and samples_per_frame == 2004.005263:
+        return ((hours * 3600 + minutes * 60 + seconds) * _FR_NUM +
+                frames * _FR_DEN) * _SPF_NUM // _FB_DIV
     
-    # Calculate TimeReference
-    time_ref = total_frames * samples_per_frame
+    fr_num, fr_den = _exact(frame_rate)
+    spf_num, spf_den = _exact(samples_per_frame)
     
-    return int(time_ref)
+    # Total frames, scaled by the frame rate denominator
+    total_frames_num = (hours * 3600 + minutes * 60 + seconds) * fr_num + frames * fr_den
+    
+    # Calculate TimeReference (truncated)
+    return total_frames_num * spf_num // (fr_den * spf_den)
 
 def verify_timereference(time_ref, sample_rate=48048, frame_rate=23.976):
     """
     Verify a TimeReference by decoding it back to timecode
     Uses TRUNCATION method
     """
-    total_seconds = time_ref / sample_rate
-    
-    h = int(total_seconds // 3600)
-    remaining = total_seconds % 3600
-    m = int(remaining // 60)
-    s_total = remaining % 60
-    s = int(s_total)
-    f = int((s_total % 1) * frame_rate)  # TRUNCATE
+    fr_num, fr_den = _exact(frame_rate)
+    
+    # Exact integers, so float arguments decode like ints: a fractional
+    # time_ref tr_num/tr_den is folded into the sample rate
+    sr_num, sr_den = _exact(sample_rate)
+    if isinstance(time_ref, int):
+        tr_num, tr_den = time_ref, 1
+    else:
+        tr = Fraction(str(time_ref))
+        tr_num, tr_den = tr.numerator, tr.denominator
+    sr_num *= tr_den
+    
+    total_seconds, sub_samples = divmod(tr_num * sr_den, sr_num)
+    total_minutes, s = divmod(total_seconds, 60)
+    h, m = divmod(total_minutes, 60)
+    f = sub_samples * fr_num // (sr_num * fr_den)  # TRUNCATE
     
     return f"{h:02d}:{m:02d}:{s:02d}:{f:02d}"
 
@@ -71,31 +106,32 @@ if __name__ == '__main__':
     args = parser.parse_args()
     
     # Parse timecode
-    try:
-        parts = args.timecode.replace(';', ':').split(':')
-        if len(parts) != 4:
-            raise ValueError
-        h, m, s, f = map(int, parts)
-    except:
+    match = _TC_RE.match(args.timecode)
+    if not match:
         print(f"Error: Invalid timecode format. Use HH:MM:SS:FF")
         exit(1)
+    h, m, s, f = map(int, match.groups())
+    
+    # Report is collected and written in one go
+    lines = []
+    out = lines.append
     
-    print(f"Frame-Based BEXT Calculator")
-    print("=" * 70)
-    print(f"Input Timecode: {h:02d}:{m:02d}:{s:02d}:{f:02d} @ {args.frame_rate}fps")
-    print()
+    out(f"Frame-Based BEXT Calculator")
+    out("=" * 70)
+    out(f"Input Timecode: {h:02d}:{m:02d}:{s:02d}:{f:02d} @ {args.frame_rate}fps")
+    out("")
     
     # Calculate using frame-based method
-    print("Calculation:")
-    print("-" * 70)
+    out("Calculation:")
+    out("-" * 70)
     total_frames = (h * 60 * 60 * args.frame_rate) + \
                    (m * 60 * args.frame_rate) + \
                    (s * args.frame_rate) + f
     
-    print(f"Total Frames = ({h}×60×60×{args.frame_rate}) + "
-          f"({m}×60×{args.frame_rate}) + ({s}×{args.frame_rate}) + {f}")
-    print(f"             = {total_frames:.10f} frames")
-    print()
+    out(f"Total Frames = ({h}×60×60×{args.frame_rate}) + "
+        f"({m}×60×{args.frame_rate}) + ({s}×{args.frame_rate}) + {f}")
+    out(f"             = {total_frames:.10f} frames")
+    out("")
     
     time_ref = calculate_timereference_frame_based(
         h, m, s, f, 
@@ -103,26 +139,27 @@ if __name__ == '__main__':
         args.multiplier
     )
     
-    print(f"TimeReference = {total_frames:.10f} × {args.multiplier}")
-    print(f"              = {time_ref:,} samples")
-    print()
+    out(f"TimeReference = {total_frames:.10f} × {args.multiplier}")
+    out(f"              = {time_ref:,} samples")
+    out("")
     
     # Verify
     if args.verify:
-        print("Verification:")
-        print("-" * 70)
+        out("Verification:")
+        out("-" * 70)
         verified_tc = verify_timereference(time_ref, args.sample_rate, args.frame_rate)
-        print(f"At {args.sample_rate} Hz with truncation:")
-        print(f"  {time_ref:,} samples → {verified_tc}")
+        out(f"At {args.sample_rate} Hz with truncation:")
+        out(f"  {time_ref:,} samples → {verified_tc}")
         
         if verified_tc == f"{h:02d}:{m:02d}:{s:02d}:{f:02d}":
-            print("  ✅ MATCH!")
+            out("  ✅ MATCH!")
         else:
-            print(f"  ⚠️  Expected: {h:02d}:{m:02d}:{s:02d}:{f:02d}")
-            print(f"  ⚠️  Got:      {verified_tc}")
+            out(f"  ⚠️  Expected: {h:02d}:{m:02d}:{s:02d}:{f:02d}")
+            out(f"  ⚠️  Got:      {verified_tc}")
     
-    print()
-    print("=" * 70)
-    print(f"BEXT TimeReference: {time_ref}")
-    print("=" * 70)
-
+    out("")
+    out("=" * 70)
+    out(f"BEXT TimeReference: {time_ref}")
+    out("=" * 70)
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
@@ -3,12 +3,31 @@
 Insert BEXT chunk with specific TimeReference into WAV file
 """
 
+import os
 import struct
 import sys
 import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from test_bwf_timecode import calculate_timecode
+
+# Variable BEXT fields: Description .. TimeReference (346 bytes)
+_BEXT_HEADER = struct.Struct("<256s32s32s10s8sQ")
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+
+# WAVE fmt chunk: FormatTag, Channels, SampleRate, ByteRate, BlockAlign, BitsPerSample
+_FMT = struct.Struct('<HHIIHH')
+
+# Invariant part of every BEXT chunk we write (minimum 602 bytes):
+# Version 1 at byte 346, UMID (64) and Reserved (180) all zeros
+_BEXT_TEMPLATE = bytearray(602)
+_U16.pack_into(_BEXT_TEMPLATE, 346, 1)
+
+_COPY_BLOCK = 65536
+_STDERR_TAIL = 8192
+
 def create_bext_chunk(time_reference, 
                       description="",
                       originator="Transkoder",
@@ -18,45 +37,134 @@ def create_bext_chunk(time_reference,
     """
     Create a BEXT chunk with specified TimeReference
     """
-    if origination_date is None:
-        origination_date = datetime.now().strftime("%Y-%m-%d")
-    if origination_time is None:
-        origination_time = datetime.now().strftime("%H:%M:%S")
-    
-    # Build BEXT chunk (minimum 602 bytes)
-    bext = bytearray(602)
+    # One snapshot, so date and time agree even across midnight; the
+    # fixed-width ASCII fields are formatted straight to bytes
+    if origination_date is None or origination_time is None:
+        now = datetime.now()
     
-    # Description (256 bytes)
-    desc_bytes = description.encode('ascii')[:256]
-    bext[0:len(desc_bytes)] = desc_bytes
-    
-    # Originator (32 bytes)
-    orig_bytes = originator.encode('ascii')[:32]
-    bext[256:256+len(orig_bytes)] = orig_bytes
+    if origination_date is None:
+        date_bytes = b"%04d-%02d-%02d" % (now.year, now.month, now.day)
+    else:
+        date_bytes = origination_date.encode('ascii')
     
-    # OriginatorReference (32 bytes)
-    orig_ref_bytes = originator_ref.encode('ascii')[:32]
-    bext[288:288+len(orig_ref_bytes)] = orig_ref_bytes
+    if origination_time is None:
+        time_bytes = b"%02d:%02d:%02d" % (now.hour, now.minute, now.second)
+    else:
+        time_bytes = origination_time.encode('ascii')
     
-    # OriginationDate (10 bytes, YYYY-MM-DD)
-    date_bytes = origination_date.encode('ascii')[:10]
-    bext[320:320+len(date_bytes)] = date_bytes
+    # Start from the template, then fill in Description (256),
+    # Originator (32), OriginatorReference (32), OriginationDate (10,
+    # YYYY-MM-DD), OriginationTime (8, HH:MM:SS) and TimeReference
+    # (8, 64-bit unsigned int, little-endian) - THE KEY VALUE!
+    # 's' fields are zero-padded automatically
+    bext = _BEXT_TEMPLATE[:]
+    _BEXT_HEADER.pack_into(
+        bext, 0,
+        description.encode('ascii')[:256],
+        originator.encode('ascii')[:32],
+        originator_ref.encode('ascii')[:32],
+        date_bytes[:10],
+        time_bytes[:8],
+        time_reference,
+    )
     
-    # OriginationTime (8 bytes, HH:MM:SS)
-    time_bytes = origination_time.encode('ascii')[:8]
-    bext[330:330+len(time_bytes)] = time_bytes
+    return bext
+
+def _copy_n(src, dst, n):
+    """
+    Copy n bytes from src to dst through a reusable 64 KB buffer
+    """
+    buf = bytearray(_COPY_BLOCK)
+    view = memoryview(buf)
+    while n:
+        r = src.readinto(view[:min(n, _COPY_BLOCK)])
+        if not r:
+            break
+        dst.write(view[:r])
+        n -= r
+
+def _copy_tail(src, dst, offset, count):
+    """
+    Copy count bytes of src starting at offset to the end of dst,
+    using the kernel zero-copy path where the platform supports it
+    """
+    dst.flush()
+    try:
+        while count:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, count)
+            if not sent:
+                return
+            offset += sent
+            count -= sent
+    except (AttributeError, OSError):
+        # No sendfile (Windows) or not allowed on regular files (macOS)
+        src.seek(offset)
+        _copy_n(src, dst, count)
+
+def _drain_last_n(stream, n):
+    """
+    Read stream to EOF, keeping only the last n bytes
+    """
+    tail = bytearray()
+    for block in iter(lambda: stream.read(_COPY_BLOCK), b''):
+        tail += block
+        if len(tail) > n:
+            del tail[:-n]
+    stream.close()
+    return bytes(tail)
+
+def _is_conformed_wav(input_file, output_file, sample_rate):
+    """
+    Check whether input_file is already a 24-bit stereo PCM WAV at
+    sample_rate with no BEXT chunk, i.e. what the ffmpeg step would produce
+    """
+    if Path(input_file).suffix.lower() != '.wav':
+        return False
+    if Path(input_file).resolve() == Path(output_file).resolve():
+        return False
     
-    # TimeReference (8 bytes, 64-bit unsigned int, little-endian) - THE KEY VALUE!
-    struct.pack_into('<Q', bext, 338, time_reference)
+    fmt = None
+    try:
+        with open(input_file, 'rb') as f:
+            header = f.read(12)
+            if len(header) < 12 or header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
+                return False
+            
+            # Track the position locally and stop at the end of the RIFF
+            # payload, rather than polling tell() or reading to EOF
+            pos = 12
+            end = 8 + _U32.unpack_from(header, 4)[0]
+            chunk_header = bytearray(8)
+            
+            while pos + 8 <= end:
+                if f.readinto(chunk_header) < 8:
+                    break
+                
+                chunk_id = chunk_header[0:4]
+                chunk_size = _U32.unpack_from(chunk_header, 4)[0]
+                pos += 8
+                
+                if chunk_id == b'bext':
+                    return False
+                elif chunk_id == b'fmt ':
+                    fmt = f.read(chunk_size)
+                
+                # Next chunk, aligned to even boundary
+                pos += chunk_size + chunk_size % 2
+                f.seek(pos)
+    except OSError:
+        # Unreadable input: let the ffmpeg path report the problem
+        return False
     
-    # Version (2 bytes)
-    struct.pack_into('<H', bext, 346, 1)  # Version 1
+    if fmt is None or len(fmt) < _FMT.size:
+        return False
     
-    # UMID (64 bytes) - all zeros
-    # Reserved (180 bytes) - all zeros
-    # Already zeroed in bytearray
+    format_tag, channels, rate, _, _, bits = _FMT.unpack_from(fmt)
+    if format_tag == 0xFFFE and len(fmt) >= 26:
+        # WAVE_FORMAT_EXTENSIBLE: PCM sub-format GUID starts with tag 1
+        format_tag = _U16.unpack_from(fmt, 24)[0]
     
-    return bytes(bext)
+    return format_tag == 1 and channels == 2 and bits == 24 and rate == sample_rate
 
 def transcode_with_bext(input_file, output_file, time_reference, sample_rate=48048, 
                         description="", originator="Transkoder", frame_rate=25):
@@ -69,45 +177,51 @@ def transcode_with_bext(input_file, output_file, time_reference, sample_rate=480
     print()
     
     # Calculate expected timecode for verification
-    total_seconds = time_reference / sample_rate
-    hours = int(total_seconds // 3600)
-    remaining = total_seconds % 3600
-    minutes = int(remaining // 60)
-    seconds = remaining % 60
-    seconds_int = int(seconds)
-    frames = int((seconds % 1) * frame_rate)
-    expected_tc = f"{hours:02d}:{minutes:02d}:{seconds_int:02d}:{frames:02d}"
+    expected_tc = calculate_timecode(time_reference, sample_rate, frame_rate)['timecode']
     
     print(f"Expected Timecode (@{frame_rate}fps): {expected_tc}")
     print()
     
-    # Create temporary WAV file with ffmpeg
-    temp_wav = output_file + ".temp.wav"
-    
-    # Transcode to WAV at specified sample rate
-    cmd = [
-        'ffmpeg',
-        '-i', str(input_file),
-        '-ar', str(sample_rate),  # Set sample rate
-        '-ac', '2',  # Stereo (adjust as needed)
-        '-c:a', 'pcm_s24le',  # 24-bit PCM
-        '-y',  # Overwrite
-        temp_wav
-    ]
-    
-    print("Step 1: Transcoding to WAV...")
-    print(f"Command: {' '.join(cmd)}")
-    print()
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.returncode != 0:
-        print(f"❌ FFmpeg failed:")
-        print(result.stderr)
-        return False
-    
-    print("✓ Transcode complete")
-    print()
+    if _is_conformed_wav(input_file, output_file, sample_rate):
+        # Already what ffmpeg would produce - insert BEXT straight from it
+        temp_wav = str(input_file)
+        delete_temp = False
+        
+        print("Step 1: Input is already a 24-bit stereo WAV at "
+              f"{sample_rate} Hz, skipping transcode")
+        print()
+    else:
+        # Create temporary WAV file with ffmpeg
+        temp_wav = output_file + ".temp.wav"
+        delete_temp = True
+        
+        # Transcode to WAV at specified sample rate
+        cmd = [
+            'ffmpeg',
+            '-i', str(input_file),
+            '-ar', str(sample_rate),  # Set sample rate
+            '-ac', '2',  # Stereo (adjust as needed)
+            '-c:a', 'pcm_s24le',  # 24-bit PCM
+            '-y',  # Overwrite
+            temp_wav
+        ]
+        
+        print("Step 1: Transcoding to WAV...")
+        print(f"Command: {' '.join(cmd)}")
+        print()
+        
+        # Only the end of ffmpeg's stderr is useful, and only on failure
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        err_tail = _drain_last_n(proc.stderr, _STDERR_TAIL)
+        proc.wait()
+        
+        if proc.returncode != 0:
+            print(f"❌ FFmpeg failed:")
+            print(err_tail.decode('utf-8', errors='replace'))
+            return False
+        
+        print("✓ Transcode complete")
+        print()
     
     # Now insert BEXT chunk
     print("Step 2: Inserting BEXT chunk...")
@@ -120,7 +234,7 @@ def transcode_with_bext(input_file, output_file, time_reference, sample_rate=480
                 print("❌ Not a valid WAV file")
                 return False
             
-            file_size = struct.unpack('<I', f_in.read(4))[0]
+            file_size = _U32.unpack(f_in.read(4))[0]
             wave = f_in.read(4)
             
             # Create BEXT chunk
@@ -130,54 +244,38 @@ def transcode_with_bext(input_file, output_file, time_reference, sample_rate=480
                 originator=originator
             )
             
+            # Everything after the RIFF header is copied verbatim, so the
+            # final RIFF size is known before writing anything
+            tail_start = f_in.tell()
+            tail_len = os.fstat(f_in.fileno()).st_size - tail_start
+            total_size = 4  # 'WAVE'
+            total_size += 8 + len(bext_data)  # 'bext' chunk
+            total_size += tail_len
+            
             # Write new WAV with BEXT
             with open(output_file, 'wb') as f_out:
-                # RIFF header (will update size later)
+                # Reserve the whole output up front (contiguous extents)
+                try:
+                    os.posix_fallocate(f_out.fileno(), 0, 8 + total_size)
+                except (AttributeError, OSError):
+                    pass
+                
+                # RIFF header
                 f_out.write(b'RIFF')
-                f_out.write(struct.pack('<I', 0))  # Placeholder
+                f_out.write(_U32.pack(total_size))
                 f_out.write(b'WAVE')
                 
                 # Write BEXT chunk first
                 f_out.write(b'bext')
-                f_out.write(struct.pack('<I', len(bext_data)))
+                f_out.write(_U32.pack(len(bext_data)))
                 f_out.write(bext_data)
                 
                 # Copy remaining chunks from original
-                total_size = 4  # 'WAVE'
-                total_size += 8 + len(bext_data)  # 'bext' chunk
-                
-                while True:
-                    chunk_id = f_in.read(4)
-                    if len(chunk_id) < 4:
-                        break
-                    
-                    chunk_size_data = f_in.read(4)
-                    if len(chunk_size_data) < 4:
-                        break
-                        
-                    chunk_size = struct.unpack('<I', chunk_size_data)[0]
-                    chunk_data = f_in.read(chunk_size)
-                    
-                    # Write chunk
-                    f_out.write(chunk_id)
-                    f_out.write(chunk_size_data)
-                    f_out.write(chunk_data)
-                    
-                    total_size += 8 + chunk_size
-                    
-                    # Align to even boundary
-                    if chunk_size % 2:
-                        padding = f_in.read(1)
-                        if padding:
-                            f_out.write(padding)
-                            total_size += 1
-                
-                # Update RIFF size
-                f_out.seek(4)
-                f_out.write(struct.pack('<I', total_size))
+                _copy_tail(f_in, f_out, tail_start, tail_len)
         
-        # Remove temp file
-        Path(temp_wav).unlink()
+        # Remove temp file (never the user's input)
+        if delete_temp:
+            Path(temp_wav).unlink()
         
         print(f"✓ BEXT chunk inserted")
         print(f"✓ Output file: {output_file}")
@@ -4,58 +4,111 @@ BWF BEXT Timecode Calculator and Tester
 Tests theory about calculating timecode from BEXT TimeReference
 """
 
+import mmap
 import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from functools import lru_cache, partial
 from pathlib import Path
 
-def read_bext_chunk(wav_file):
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+# TimeReference is the last field needed for timecode: bytes 338..346
+_BEXT_TIME_REF_END = 346
+
+def read_bext_chunk(wav_file, limit=None):
     """
     Read BEXT chunk from BWF (Broadcast Wave Format) file
+    
+    Args:
+        wav_file: Path to the BWF file
+        limit: Only copy the first limit bytes of the BEXT chunk (default all)
     """
     with open(wav_file, 'rb') as f:
         # Read RIFF header
-        riff = f.read(4)
-        if riff != b'RIFF':
+        header = f.read(12)
+        if header[0:4] != b'RIFF':
             raise ValueError("Not a valid WAV file")
         
-        file_size = struct.unpack('<I', f.read(4))[0]
-        wave = f.read(4)
-        if wave != b'WAVE':
+        file_size = _U32.unpack_from(header, 4)[0]
+        if header[8:12] != b'WAVE':
             raise ValueError("Not a valid WAV file")
         
         # Find BEXT and fmt chunks
         bext_data = None
         sample_rate = None
         
-        while f.tell() < file_size:
-            try:
-                chunk_id = f.read(4)
-                if len(chunk_id) < 4:
-                    break
+        # Walk chunk headers as offsets into a read-only mapping rather
+        # than issuing tell/seek/read calls per chunk
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = min(len(mm), 8 + file_size)
+            offset = 12
+            
+            while offset + 8 <= end:
+                try:
+                    chunk_id = mm[offset:offset + 4]
+                    chunk_size = _U32.unpack_from(mm, offset + 4)[0]
+                    body = offset + 8
                     
-                chunk_size = struct.unpack('<I', f.read(4))[0]
-                
-                if chunk_id == b'bext':
-                    # Read BEXT chunk
-                    bext_data = f.read(chunk_size)
-                elif chunk_id == b'fmt ':
-                    # Read format chunk to get sample rate
-                    fmt_data = f.read(chunk_size)
-                    sample_rate = struct.unpack('<I', fmt_data[4:8])[0]
-                else:
-                    # Skip other chunks
-                    f.seek(chunk_size, 1)
+                    if chunk_id == b'bext':
+                        # Copy BEXT chunk out (the mapping closes on return)
+                        size = chunk_size if limit is None else min(chunk_size, limit)
+                        bext_data = mm[body:body + size]
+                    elif chunk_id == b'fmt ':
+                        # Read format chunk to get sample rate
+                        sample_rate = _U32.unpack_from(mm, body + 4)[0]
                     
-                # Align to even boundary
-                if chunk_size % 2:
-                    f.read(1)
+                    # Nothing else to look for once both are found
+                    if bext_data is not None and sample_rate is not None:
+                        break
                     
-            except Exception as e:
-                print(f"Error reading chunk: {e}")
-                break
+                    # Skip to next chunk, aligned to even boundary
+                    offset = body + chunk_size + (chunk_size & 1)
+                    
+                except Exception as e:
+                    print(f"Error reading chunk: {e}")
+                    break
         
         return bext_data, sample_rate
 
+def _scan_one(wav_file, limit=None):
+    """read_bext_chunk for one file of a batch, (wav_file, None, None) if unreadable"""
+    try:
+        bext_data, sample_rate = read_bext_chunk(wav_file, limit)
+    except (OSError, ValueError):
+        return wav_file, None, None
+    return wav_file, bext_data, sample_rate
+
+def scan_many(wav_files, workers=8, limit=None):
+    """
+    Read BEXT chunks from many BWF files concurrently
+    
+    The work is file I/O plus a small parse, so threads are enough to
+    overlap disk latency across files. A missing, unreadable or non-WAV
+    file does not abort the batch; it gets None for bext_data and
+    sample_rate.
+    
+    Args:
+        limit: Passed to read_bext_chunk (default: whole BEXT chunk)
+    
+    Returns:
+        List of (wav_file, bext_data, sample_rate) in input order
+    """
+    with ThreadPoolExecutor(workers) as ex:
+        return list(ex.map(partial(_scan_one, limit=limit), wav_files))
+
+def _cstr(buf, start, length):
+    """
+    Decode a fixed-size, NUL-padded ASCII field, ignoring the padding
+    """
+    end = buf.find(b'\x00', start, start + length)
+    if end == -1:
+        end = start + length
+    return buf[start:end].decode('ascii', errors='ignore')
+
 def parse_bext(bext_data):
     """
     Parse BEXT chunk data
@@ -79,27 +132,27 @@ def parse_bext(bext_data):
     if not bext_data or len(bext_data) < 602:
         raise ValueError("Invalid BEXT data")
     
-    description = bext_data[0:256].decode('ascii', errors='ignore').rstrip('\x00')
-    originator = bext_data[256:288].decode('ascii', errors='ignore').rstrip('\x00')
-    originator_ref = bext_data[288:320].decode('ascii', errors='ignore').rstrip('\x00')
-    origination_date = bext_data[320:330].decode('ascii', errors='ignore').rstrip('\x00')
-    origination_time = bext_data[330:338].decode('ascii', errors='ignore').rstrip('\x00')
+    description = _cstr(bext_data, 0, 256)
+    originator = _cstr(bext_data, 256, 32)
+    originator_ref = _cstr(bext_data, 288, 32)
+    origination_date = _cstr(bext_data, 320, 10)
+    origination_time = _cstr(bext_data, 330, 8)
     
     # TimeReference is at byte 338, 8 bytes (64-bit unsigned integer, little-endian)
-    time_reference = struct.unpack('<Q', bext_data[338:346])[0]
+    time_reference = _U64.unpack_from(bext_data, 338)[0]
     
-    version = struct.unpack('<H', bext_data[346:348])[0]
+    version = _U16.unpack_from(bext_data, 346)[0]
     umid = bext_data[348:412].hex()
     
     # Optional fields (version >= 1)
     loudness_value = None
     if len(bext_data) >= 414:
-        loudness_value = struct.unpack('<H', bext_data[412:414])[0]
+        loudness_value = _U16.unpack_from(bext_data, 412)[0]
     
     # Coding history starts at byte 602
     coding_history = ''
     if len(bext_data) > 602:
-        coding_history = bext_data[602:].decode('ascii', errors='ignore').rstrip('\x00')
+        coding_history = _cstr(bext_data, 602, len(bext_data) - 602)
     
     return {
         'description': description,
@@ -114,6 +167,31 @@ def parse_bext(bext_data):
         'coding_history': coding_history,
     }
 
+@lru_cache(maxsize=None)
+def _exact_ratio(value):
+    """Exact (numerator, denominator) of an int, float or decimal-string rate"""
+    frac = Fraction(str(value))
+    return frac.numerator, frac.denominator
+
+def _calc_tc_core(time_reference, sr_num, sr_den, fr_num, fr_den):
+    """
+    Split a TimeReference into (hours, minutes, seconds, frames)
+    
+    Numeric kernel of calculate_timecode, kept free of dict/string
+    building so batch callers can use it directly. Sample and frame
+    rates are passed as exact num/den pairs (see _exact_ratio) and only
+    integer divmod runs here, so results are exact for any time_reference.
+    """
+    # Whole seconds since midnight plus leftover samples (scaled by sr_den)
+    total_seconds, sub_samples = divmod(time_reference * sr_den, sr_num)
+    total_minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(total_minutes, 60)
+    
+    # Frames (truncated) from the leftover samples
+    frames = sub_samples * fr_num // (sr_num * fr_den)
+    
+    return hours, minutes, seconds, frames
+
 def calculate_timecode(time_reference, sample_rate, frame_rate=25, drop_frame=False):
     """
     Calculate timecode from TimeReference and sample rate
@@ -127,18 +205,20 @@ def calculate_timecode(time_reference, sample_rate, frame_rate=25, drop_frame=Fa
     Returns:
         Dictionary with various timecode representations
     """
-    # Calculate total seconds since midnight
     total_seconds = time_reference / sample_rate
     
-    # Calculate hours, minutes, seconds
-    hours = int(total_seconds // 3600)
-    remaining = total_seconds % 3600
-    minutes = int(remaining // 60)
-    seconds = remaining % 60
-    
-    # Calculate frames
-    frames = int((seconds % 1) * frame_rate)
-    seconds_int = int(seconds)
+    # Exact integers for the kernel, so float arguments decode like ints.
+    # A fractional time_reference tr_num/tr_den is folded into the sample
+    # rate: (tr_num/tr_den) / sample_rate == tr_num / (sample_rate*tr_den)
+    sr_num, sr_den = _exact_ratio(sample_rate)
+    if isinstance(time_reference, int):
+        tr_num, tr_den = time_reference, 1
+    else:
+        tr = Fraction(str(time_reference))
+        tr_num, tr_den = tr.numerator, tr.denominator
+    hours, minutes, seconds_int, frames = _calc_tc_core(tr_num, sr_num * tr_den, sr_den,
+                                                        *_exact_ratio(frame_rate))
+    seconds = total_seconds % 60
     
     # Format timecode
     drop_char = ';' if drop_frame else ':'
@@ -156,44 +236,74 @@ def calculate_timecode(time_reference, sample_rate, frame_rate=25, drop_frame=Fa
         'frame_rate': frame_rate,
     }
 
+def scan_timecodes(wav_files, frame_rate=25, workers=8):
+    """
+    Calculate timecodes for many BWF files in one batch
+    
+    Only the BEXT prefix up to TimeReference is copied out of each file,
+    and the description/originator fields are never decoded.
+    
+    Returns:
+        List of (wav_file, time_reference, sample_rate, (h, m, s, f)) in
+        input order; time_reference and the tuple are None when a file
+        has no usable BEXT chunk or sample rate (or is not a readable WAV)
+    """
+    fr_num, fr_den = _exact_ratio(frame_rate)
+    results = []
+    for wav_file, bext_prefix, sample_rate in scan_many(wav_files, workers,
+                                                        limit=_BEXT_TIME_REF_END):
+        if not bext_prefix or len(bext_prefix) < _BEXT_TIME_REF_END or not sample_rate:
+            results.append((wav_file, None, sample_rate, None))
+            continue
+        
+        time_reference = _U64.unpack_from(bext_prefix, 338)[0]
+        results.append((wav_file, time_reference, sample_rate,
+                        _calc_tc_core(time_reference, sample_rate, 1, fr_num, fr_den)))
+    
+    return results
+
 def test_theory(wav_file, expected_timecode=None, frame_rate=25):
     """
     Test the BWF timecode calculation theory
     """
-    print(f"Testing BWF file: {wav_file}")
-    print("=" * 80)
+    # Report is collected and written in one go
+    lines = []
+    out = lines.append
+    
+    out(f"Testing BWF file: {wav_file}")
+    out("=" * 80)
     
     try:
         # Read BEXT chunk
         bext_data, sample_rate = read_bext_chunk(wav_file)
         
         if not bext_data:
-            print("❌ No BEXT chunk found in file")
+            out("❌ No BEXT chunk found in file")
             return False
         
         if not sample_rate:
-            print("❌ Could not determine sample rate")
+            out("❌ Could not determine sample rate")
             return False
         
-        print(f"✓ Found BEXT chunk ({len(bext_data)} bytes)")
-        print(f"✓ Sample Rate: {sample_rate} Hz")
-        print()
+        out(f"✓ Found BEXT chunk ({len(bext_data)} bytes)")
+        out(f"✓ Sample Rate: {sample_rate} Hz")
+        out("")
         
         # Parse BEXT
         bext_info = parse_bext(bext_data)
         
-        print("BEXT Metadata:")
-        print("-" * 80)
-        print(f"Description: {bext_info['description']}")
-        print(f"Originator: {bext_info['originator']}")
-        print(f"Originator Reference: {bext_info['originator_reference']}")
-        print(f"Origination Date: {bext_info['origination_date']}")
-        print(f"Origination Time: {bext_info['origination_time']}")
-        print(f"TimeReference: {bext_info['time_reference']:,} samples")
-        print(f"Version: {bext_info['version']}")
+        out("BEXT Metadata:")
+        out("-" * 80)
+        out(f"Description: {bext_info['description']}")
+        out(f"Originator: {bext_info['originator']}")
+        out(f"Originator Reference: {bext_info['originator_reference']}")
+        out(f"Origination Date: {bext_info['origination_date']}")
+        out(f"Origination Time: {bext_info['origination_time']}")
+        out(f"TimeReference: {bext_info['time_reference']:,} samples")
+        out(f"Version: {bext_info['version']}")
         if bext_info['umid']:
-            print(f"UMID: {bext_info['umid'][:32]}...")
-        print()
+            out(f"UMID: {bext_info['umid'][:32]}...")
+        out("")
         
         # Calculate timecode
         tc_info = calculate_timecode(
@@ -202,69 +312,77 @@ def test_theory(wav_file, expected_timecode=None, frame_rate=25):
             frame_rate
         )
         
-        print("Calculated Timecode:")
-        print("-" * 80)
-        print(f"Total Seconds from Midnight: {tc_info['total_seconds']:.6f}")
-        print(f"Timecode (@{frame_rate}fps): {tc_info['timecode']}")
-        print(f"  Hours: {tc_info['hours']:02d}")
-        print(f"  Minutes: {tc_info['minutes']:02d}")
-        print(f"  Seconds: {int(tc_info['seconds']):02d}")
-        print(f"  Frames: {tc_info['frames']:02d}")
-        print()
+        out("Calculated Timecode:")
+        out("-" * 80)
+        out(f"Total Seconds from Midnight: {tc_info['total_seconds']:.6f}")
+        out(f"Timecode (@{frame_rate}fps): {tc_info['timecode']}")
+        out(f"  Hours: {tc_info['hours']:02d}")
+        out(f"  Minutes: {tc_info['minutes']:02d}")
+        out(f"  Seconds: {int(tc_info['seconds']):02d}")
+        out(f"  Frames: {tc_info['frames']:02d}")
+        out("")
         
         # Test against expected
         if expected_timecode:
-            print(f"Expected Timecode: {expected_timecode}")
-            print(f"Calculated Timecode: {tc_info['timecode']}")
+            out(f"Expected Timecode: {expected_timecode}")
+            out(f"Calculated Timecode: {tc_info['timecode']}")
             
             if tc_info['timecode'] == expected_timecode:
-                print("✅ MATCH! Theory is correct!")
+                out("✅ MATCH! Theory is correct!")
                 return True
             else:
-                print("❌ MISMATCH! Theory needs adjustment")
-                print()
-                print("Debugging Info:")
-                print(f"  TimeReference: {bext_info['time_reference']}")
-                print(f"  Sample Rate: {sample_rate}")
-                print(f"  Calculation: {bext_info['time_reference']} / {sample_rate} = {tc_info['total_seconds']:.6f} seconds")
+                out("❌ MISMATCH! Theory needs adjustment")
+                out("")
+                out("Debugging Info:")
+                out(f"  TimeReference: {bext_info['time_reference']}")
+                out(f"  Sample Rate: {sample_rate}")
+                out(f"  Calculation: {bext_info['time_reference']} / {sample_rate} = {tc_info['total_seconds']:.6f} seconds")
                 return False
         else:
-            print("✅ Calculation complete (no expected timecode to compare)")
+            out("✅ Calculation complete (no expected timecode to compare)")
             return True
             
     except Exception as e:
-        print(f"❌ Error: {e}")
+        out(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 def manual_test(time_reference, sample_rate, expected_timecode, frame_rate=25):
     """
     Manually test a theory with specific values
     """
-    print(f"Manual Test")
-    print("=" * 80)
-    print(f"Time Reference: {time_reference:,} samples")
-    print(f"Sample Rate: {sample_rate:,} Hz")
-    print(f"Frame Rate: {frame_rate} fps")
-    print(f"Expected Timecode: {expected_timecode}")
-    print()
+    lines = []
+    out = lines.append
+    
+    out(f"Manual Test")
+    out("=" * 80)
+    out(f"Time Reference: {time_reference:,} samples")
+    out(f"Sample Rate: {sample_rate:,} Hz")
+    out(f"Frame Rate: {frame_rate} fps")
+    out(f"Expected Timecode: {expected_timecode}")
+    out("")
     
     tc_info = calculate_timecode(time_reference, sample_rate, frame_rate)
     
-    print("Calculated:")
-    print(f"  Total Seconds: {tc_info['total_seconds']:.6f}")
-    print(f"  Timecode: {tc_info['timecode']}")
-    print()
+    out("Calculated:")
+    out(f"  Total Seconds: {tc_info['total_seconds']:.6f}")
+    out(f"  Timecode: {tc_info['timecode']}")
+    out("")
     
-    if tc_info['timecode'] == expected_timecode:
-        print("✅ MATCH! Theory is correct!")
-        return True
+    match = tc_info['timecode'] == expected_timecode
+    if match:
+        out("✅ MATCH! Theory is correct!")
     else:
-        print("❌ MISMATCH!")
-        print(f"  Expected:   {expected_timecode}")
-        print(f"  Calculated: {tc_info['timecode']}")
-        return False
+        out("❌ MISMATCH!")
+        out(f"  Expected:   {expected_timecode}")
+        out(f"  Calculated: {tc_info['timecode']}")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return match
 
 if __name__ == '__main__':
     import argparse
@@ -3,90 +3,308 @@
 Comprehensive test of the frame-based BEXT calculation method
 """
 
-import subprocess
+import os
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple, Union
 
-def calculate_frame_based(h, m, s, f, frame_rate=23.976, samples_per_frame=2004.005263):
+# Exact rational rate (num/den). Decimal constants such as 23.976 and
+# 2004.005263 are converted exactly, so all calculations below are
+# integer-only and free of floating point drift.
+class Rate(NamedTuple):
+    num: int
+    den: int
+
+# A frame rate / samples-per-frame constant: a decimal or an exact Rate
+RateLike = Union[float, Rate]
+
+# (hours, minutes, seconds, frames)
+Timecode = Tuple[int, int, int, int]
+
+@lru_cache(maxsize=None)
+def _rate(value: RateLike) -> Rate:
+    """Exact Rate for a decimal constant (23.976 -> 2997/125)"""
+    if isinstance(value, Rate):
+        return value
+    frac = Fraction(str(value))
+    return Rate(frac.numerator, frac.denominator)
+
+def _round_div(n: int, d: int) -> int:
+    """n / d rounded half to even, like round()"""
+    q, r = divmod(n, d)
+    if 2 * r > d or (2 * r == d and q % 2):
+        q += 1
+    return q
+
+# Calibrated frame-based constants and the tested sample rates
+FRAME_RATE = 23.976
+SAMPLES_PER_FRAME = 2004.005263
+SR_48K = 48000
+SR_48048 = 48048
+
+# Integer coefficients for the default frame rate, folded once:
+# (h*3600 + m*60 + s) * fr.num + f * fr.den
+_FR = _rate(FRAME_RATE)
+_SPF = _rate(SAMPLES_PER_FRAME)
+_H_COEF = 3600 * _FR.num
+_M_COEF = 60 * _FR.num
+_S_COEF = _FR.num
+_F_COEF = _FR.den
+_FB_DIV = _FR.den * _SPF.den
+
+def calculate_frame_based(h: int, m: int, s: int, f: int, frame_rate: RateLike = FRAME_RATE,
+                          samples_per_frame: RateLike = SAMPLES_PER_FRAME) -> int:
     """Frame-based calculation"""
-    total_frames = (h * 60 * 60 * frame_rate) + (m * 60 * frame_rate) + (s * frame_rate) + f
-    time_ref = int(total_frames * samples_per_frame)
+    if frame_rate == FRAME_RATE and samples_per_frame == SAMPLES_PER_FRAME:
+        return (h*_H_COEF + m*_M_COEF + s*_S_COEF + f*_F_COEF) * _SPF.num // _FB_DIV
+    
+    fr = _rate(frame_rate)
+    spf = _rate(samples_per_frame)
+    total_frames_num = (h*3600 + m*60 + s) * fr.num + f * fr.den  # frames * fr.den
+    time_ref = total_frames_num * spf.num // (fr.den * spf.den)
     return time_ref
 
-def calculate_standard(h, m, s, f, frame_rate=23.976, sample_rate=48000):
+def calculate_standard(h: int, m: int, s: int, f: int, frame_rate: RateLike = FRAME_RATE,
+                       sample_rate: int = SR_48K) -> int:
     """Standard time-based calculation"""
-    total_seconds = h*3600 + m*60 + s + (f / frame_rate)
-    time_ref = int(total_seconds * sample_rate)
+    if frame_rate == FRAME_RATE:
+        return (h*_H_COEF + m*_M_COEF + s*_S_COEF + f*_F_COEF) * sample_rate // _FR.num
+    
+    fr = _rate(frame_rate)
+    total_seconds_num = (h*3600 + m*60 + s) * fr.num + f * fr.den  # seconds * fr.num
+    time_ref = total_seconds_num * sample_rate // fr.num
     return time_ref
 
-def verify_truncate(time_ref, sample_rate=48048, frame_rate=23.976):
+def _split_samples(time_ref: int, sample_rate: int) -> Timecode:
+    """Split a TimeReference into (h, m, s, leftover samples) with divmod"""
+    total_seconds, sub_samples = divmod(time_ref, sample_rate)
+    total_minutes, s = divmod(total_seconds, 60)
+    h, m = divmod(total_minutes, 60)
+    return h, m, s, sub_samples
+
+def verify_truncate(time_ref: int, sample_rate: int = SR_48048,
+                    frame_rate: RateLike = FRAME_RATE) -> Timecode:
     """Decode TimeReference using truncation"""
-    total_seconds = time_ref / sample_rate
-    h = int(total_seconds // 3600)
-    remaining = total_seconds % 3600
-    m = int(remaining // 60)
-    s_total = remaining % 60
-    s = int(s_total)
-    f = int((s_total % 1) * frame_rate)
+    fr = _rate(frame_rate)
+    h, m, s, sub_samples = _split_samples(time_ref, sample_rate)
+    f = sub_samples * fr.num // (sample_rate * fr.den)
     return (h, m, s, f)
 
-def verify_round(time_ref, sample_rate=48000, frame_rate=23.976):
+def verify_round(time_ref: int, sample_rate: int = SR_48K,
+                 frame_rate: RateLike = FRAME_RATE) -> Timecode:
     """Decode TimeReference using rounding"""
-    total_seconds = time_ref / sample_rate
-    h = int(total_seconds // 3600)
-    remaining = total_seconds % 3600
-    m = int(remaining // 60)
-    s_total = remaining % 60
-    s = int(s_total)
-    f = round((s_total % 1) * frame_rate)
+    fr = _rate(frame_rate)
+    h, m, s, sub_samples = _split_samples(time_ref, sample_rate)
+    f = _round_div(sub_samples * fr.num, sample_rate * fr.den)
     return (h, m, s, f)
 
-def test_timecode(h, m, s, f, frame_rate=23.976):
-    """Test a single timecode"""
-    original = (h, m, s, f)
+def _decodes_to(time_ref: int, h: int, m: int, s: int, f: int, sample_rate: int,
+                frame_rate: RateLike = FRAME_RATE, rounded: bool = False) -> bool:
+    """
+    True if time_ref decodes back to (h, m, s, f)
+    
+    Same result as comparing verify_truncate (or verify_round when
+    rounded) against the timecode, but compares each component in place
+    and stops at the first mismatch instead of building the tuple.
+    """
+    total_seconds, sub_samples = divmod(time_ref, sample_rate)
+    total_minutes, s2 = divmod(total_seconds, 60)
+    if s2 != s:
+        return False
+    h2, m2 = divmod(total_minutes, 60)
+    if m2 != m or h2 != h:
+        return False
+    
+    fr = _rate(frame_rate)
+    n, d = sub_samples * fr.num, sample_rate * fr.den
+    return (_round_div(n, d) if rounded else n // d) == f
+
+def check_frame(h: int, m: int, s: int, f: int,
+                frame_rate: RateLike = FRAME_RATE) -> Tuple[int, bool]:
+    """
+    Frame-based encode and truncation decode at 48048 Hz in one pass
     
-    # Calculate using frame method
-    time_ref_frame = calculate_frame_based(h, m, s, f, frame_rate)
+    Use verify_truncate to get the decoded tuple for a failure report.
+    
+    Returns:
+        (time_ref, match)
+    """
+    time_ref = calculate_frame_based(h, m, s, f, frame_rate)
+    return time_ref, _decodes_to(time_ref, h, m, s, f, SR_48048, frame_rate)
+
+class TCResult(NamedTuple):
+    """Outcome of test_timecode for a single timecode"""
+    original: Timecode
+    fm_ref: int
+    fm_decoded: Timecode
+    fm_match: bool
+    s48k_ref: int
+    s48k_decoded: Timecode
+    s48k_match: bool
+    s48048_ref: int
+    s48048_decoded: Timecode
+    s48048_match: bool
+
+class TCBatch:
+    """
+    Outcome of test_timecode_batch, one list per TCResult field
+    
+    fm_* is the frame method (48048 Hz, truncate), s48k_* the standard
+    method (48000 Hz, round), s48048_* the standard method (48048 Hz,
+    truncate). Slotted in plain Python; mypyc compiles it to a native
+    class with the same fixed layout.
+    """
+    __slots__ = TCResult._fields
+    
+    original: List[Timecode]
+    fm_ref: List[int]
+    fm_decoded: List[Timecode]
+    fm_match: List[bool]
+    s48k_ref: List[int]
+    s48k_decoded: List[Timecode]
+    s48k_match: List[bool]
+    s48048_ref: List[int]
+    s48048_decoded: List[Timecode]
+    s48048_match: List[bool]
+    
+    def __init__(self, original: List[Timecode],
+                 fm_ref: List[int], fm_decoded: List[Timecode], fm_match: List[bool],
+                 s48k_ref: List[int], s48k_decoded: List[Timecode], s48k_match: List[bool],
+                 s48048_ref: List[int], s48048_decoded: List[Timecode],
+                 s48048_match: List[bool]) -> None:
+        self.original = original
+        self.fm_ref = fm_ref
+        self.fm_decoded = fm_decoded
+        self.fm_match = fm_match
+        self.s48k_ref = s48k_ref
+        self.s48k_decoded = s48k_decoded
+        self.s48k_match = s48k_match
+        self.s48048_ref = s48048_ref
+        self.s48048_decoded = s48048_decoded
+        self.s48048_match = s48048_match
+
+def test_timecode_batch(test_cases: Iterable[Sequence[int]],
+                        frame_rate: RateLike = FRAME_RATE) -> TCBatch:
+    """
+    Test many timecodes at once
+    
+    Each method is computed as a column over all test cases, so no
+    per-case result objects are built.
+    """
+    originals: List[Timecode] = [(h, m, s, f) for h, m, s, f in test_cases]
+    
+    # Calculate using frame method, verified with truncation at 48048 Hz
+    fm_checked = [check_frame(h, m, s, f, frame_rate) for h, m, s, f in originals]
+    fm_ref = [time_ref for time_ref, _ in fm_checked]
+    fm_match = [match for _, match in fm_checked]
     
     # Calculate using standard method at 48000 Hz
-    time_ref_std_48k = calculate_standard(h, m, s, f, frame_rate, 48000)
+    s48k_ref = [calculate_standard(h, m, s, f, frame_rate, SR_48K) for h, m, s, f in originals]
     
     # Calculate using standard method at 48048 Hz
-    time_ref_std_48048 = calculate_standard(h, m, s, f, frame_rate, 48048)
-    
-    # Verify frame method with truncation at 48048 Hz
-    decoded_frame = verify_truncate(time_ref_frame, 48048, frame_rate)
-    
-    # Verify standard 48k with rounding
-    decoded_std_48k = verify_round(time_ref_std_48k, 48000, frame_rate)
-    
-    # Verify standard 48048 with truncation
-    decoded_std_48048 = verify_truncate(time_ref_std_48048, 48048, frame_rate)
-    
-    return {
-        'original': original,
-        'frame_method': {
-            'time_ref': time_ref_frame,
-            'decoded': decoded_frame,
-            'match': decoded_frame == original
-        },
-        'standard_48k': {
-            'time_ref': time_ref_std_48k,
-            'decoded': decoded_std_48k,
-            'match': decoded_std_48k == original
-        },
-        'standard_48048': {
-            'time_ref': time_ref_std_48048,
-            'decoded': decoded_std_48048,
-            'match': decoded_std_48048 == original
-        }
-    }
-
-def format_tc(tc_tuple):
+    s48048_ref = [calculate_standard(h, m, s, f, frame_rate, SR_48048) for h, m, s, f in originals]
+    
+    # Verify standard 48k with rounding, standard 48048 with truncation
+    s48k_match = [_decodes_to(r, h, m, s, f, SR_48K, frame_rate, rounded=True)
+                  for r, (h, m, s, f) in zip(s48k_ref, originals)]
+    s48048_match = [_decodes_to(r, h, m, s, f, SR_48048, frame_rate)
+                    for r, (h, m, s, f) in zip(s48048_ref, originals)]
+    
+    # Decode only where a method failed (else the decode is the original)
+    fm_decoded = [o if match else verify_truncate(r, SR_48048, frame_rate)
+                  for o, r, match in zip(originals, fm_ref, fm_match)]
+    s48k_decoded = [o if match else verify_round(r, SR_48K, frame_rate)
+                    for o, r, match in zip(originals, s48k_ref, s48k_match)]
+    s48048_decoded = [o if match else verify_truncate(r, SR_48048, frame_rate)
+                      for o, r, match in zip(originals, s48048_ref, s48048_match)]
+    
+    return TCBatch(
+        originals,
+        fm_ref, fm_decoded, fm_match,
+        s48k_ref, s48k_decoded, s48k_match,
+        s48048_ref, s48048_decoded, s48048_match
+    )
+
+@lru_cache(maxsize=4096)
+def test_timecode(h: int, m: int, s: int, f: int, frame_rate: RateLike = FRAME_RATE) -> TCResult:
+    """
+    Test a single timecode (thin wrapper over test_timecode_batch)
+    
+    Pure function of (h, m, s, f, frame_rate); safe to memoize. The
+    result is immutable, use test_timecode.cache_clear() to reset.
+    """
+    batch = test_timecode_batch([(h, m, s, f)], frame_rate)
+    return TCResult(*(getattr(batch, name)[0] for name in TCResult._fields))
+
+# Below this many cases a process pool costs more than it saves
+_PARALLEL_MIN_CASES = 1024
+
+def full_day_cases() -> List[Timecode]:
+    """Every timecode of the day at 24 frame labels per second"""
+    return [(h, m, s, f) for h in range(24) for m in range(60)
+            for s in range(60) for f in range(24)]
+
+def _sweep_worker(args: Tuple[List[Timecode], RateLike]) -> Tuple[List[int], List[Tuple[Timecode, Timecode]]]:
+    """Pass counts and frame-method failures for one shard of test cases"""
+    test_cases, frame_rate = args
+    batch = test_timecode_batch(test_cases, frame_rate)
+    pass_counts = [sum(batch.fm_match), sum(batch.s48k_match), sum(batch.s48048_match)]
+    failures = [(original, decoded) for original, decoded, match
+                in zip(batch.original, batch.fm_decoded, batch.fm_match) if not match]
+    return pass_counts, failures
+
+def sweep(test_cases: Iterable[Timecode],
+          frame_rate: RateLike = FRAME_RATE) -> Tuple[List[int], List[Tuple[Timecode, Timecode]]]:
+    """
+    Test a large matrix of timecodes without building a per-case report
+    
+    Cases are independent, so above _PARALLEL_MIN_CASES they are sharded
+    across one process per CPU (in-process on a single CPU, where a pool
+    would only add pickling).
+    
+    Returns:
+        ([frame_method, standard_48k, standard_48048] pass counts,
+        [(original, decoded)] for each frame-method failure)
+    """
+    cases = list(test_cases)
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(cases) <= _PARALLEL_MIN_CASES:
+        return _sweep_worker((cases, frame_rate))
+    
+    shard = -(-len(cases) // workers)
+    shards = [(cases[i:i + shard], frame_rate) for i in range(0, len(cases), shard)]
+    
+    with ProcessPoolExecutor(workers) as ex:
+        results = list(ex.map(_sweep_worker, shards))
+    
+    pass_counts = [sum(counts) for counts in zip(*(counts for counts, _ in results))]
+    failures: List[Tuple[Timecode, Timecode]] = []
+    for _, shard_failures in results:
+        failures.extend(shard_failures)
+    return pass_counts, failures
+
+def _status_tokens() -> Tuple[str, str]:
+    """
+    (PASS, FAIL) report tokens, coloured with ANSI escapes only when
+    stdout is currently a terminal (checked per report, not at import)
+    """
+    if sys.stdout is not None and sys.stdout.isatty():
+        return "\x1b[32mPASS\x1b[0m", "\x1b[31mFAIL\x1b[0m"
+    return "PASS", "FAIL"
+
+@lru_cache(maxsize=8192)
+def format_tc(tc_tuple: Timecode) -> str:
     """Format timecode tuple as string"""
     return f"{tc_tuple[0]:02d}:{tc_tuple[1]:02d}:{tc_tuple[2]:02d}:{tc_tuple[3]:02d}"
 
-def run_tests():
+@lru_cache(maxsize=8192)
+def _thousands(value: int) -> str:
+    """Format an int with thousands separators"""
+    return f"{value:,}"
+
+def run_tests() -> bool:
     """Run comprehensive tests"""
     
     test_cases = [
@@ -115,115 +333,153 @@ def run_tests():
         (0, 0, 0, 1),      # 1 frame
     ]
     
-    print("=" * 80)
-    print("FRAME-BASED BEXT METHOD - COMPREHENSIVE TEST")
-    print("=" * 80)
-    print()
+    # Report is collected and written in one go
+    lines: List[str] = []
+    out = lines.append
+    pass_token, fail_token = _status_tokens()
+    
+    out("=" * 80)
+    out("FRAME-BASED BEXT METHOD - COMPREHENSIVE TEST")
+    out("=" * 80)
+    out("")
     
-    results = {
-        'frame_method': {'pass': 0, 'fail': 0},
-        'standard_48k': {'pass': 0, 'fail': 0},
-        'standard_48048': {'pass': 0, 'fail': 0}
-    }
+    # Failure records, one list per field
+    fail_tests: List[int] = []
+    fail_tcs: List[str] = []
+    fail_methods: List[str] = []
+    fail_decoded: List[str] = []
     
-    failures = []
+    batch = test_timecode_batch(test_cases)
+    total_tests = len(batch.original)
     
-    for i, (h, m, s, f) in enumerate(test_cases, 1):
-        result = test_timecode(h, m, s, f)
-        original_tc = format_tc(result['original'])
+    # Pass/fail counts straight from the match columns (bool is int)
+    results: Dict[str, Dict[str, int]] = {}
+    for method, matches in (('frame_method', batch.fm_match),
+                            ('standard_48k', batch.s48k_match),
+                            ('standard_48048', batch.s48048_match)):
+        passed = sum(matches)
+        results[method] = {'pass': passed, 'fail': total_tests - passed}
+    
+    # Report (the arithmetic is already done for every case)
+    for idx, original in enumerate(batch.original):
+        i = idx + 1
+        original_tc = format_tc(original)
         
-        print(f"Test {i:2d}: {original_tc}")
-        print("-" * 80)
+        out(f"Test {i:2d}: {original_tc}")
+        out("-" * 80)
         
         # Frame method
-        fm = result['frame_method']
-        status = "✅ PASS" if fm['match'] else "❌ FAIL"
-        print(f"  Frame Method (48048 Hz, truncate):  {fm['time_ref']:,}")
-        print(f"    Decoded: {format_tc(fm['decoded'])} {status}")
+        status = pass_token if batch.fm_match[idx] else fail_token
+        out(f"  Frame Method (48048 Hz, truncate):  {_thousands(batch.fm_ref[idx])}")
+        out(f"    Decoded: {format_tc(batch.fm_decoded[idx])} {status}")
         
-        if fm['match']:
-            results['frame_method']['pass'] += 1
-        else:
-            results['frame_method']['fail'] += 1
-            failures.append({
-                'test': i,
-                'timecode': original_tc,
-                'method': 'Frame Method',
-                'decoded': format_tc(fm['decoded'])
-            })
+        if not batch.fm_match[idx]:
+            fail_tests.append(i)
+            fail_tcs.append(original_tc)
+            fail_methods.append('Frame Method')
+            fail_decoded.append(format_tc(batch.fm_decoded[idx]))
         
         # Standard 48k
-        s48k = result['standard_48k']
-        status = "✅ PASS" if s48k['match'] else "❌ FAIL"
-        print(f"  Standard Method (48000 Hz, round):  {s48k['time_ref']:,}")
-        print(f"    Decoded: {format_tc(s48k['decoded'])} {status}")
-        
-        if s48k['match']:
-            results['standard_48k']['pass'] += 1
-        else:
-            results['standard_48k']['fail'] += 1
+        status = pass_token if batch.s48k_match[idx] else fail_token
+        out(f"  Standard Method (48000 Hz, round):  {_thousands(batch.s48k_ref[idx])}")
+        out(f"    Decoded: {format_tc(batch.s48k_decoded[idx])} {status}")
         
         # Standard 48048
-        s48048 = result['standard_48048']
-        status = "✅ PASS" if s48048['match'] else "❌ FAIL"
-        print(f"  Standard Method (48048 Hz, truncate): {s48048['time_ref']:,}")
-        print(f"    Decoded: {format_tc(s48048['decoded'])} {status}")
-        
-        if s48048['match']:
-            results['standard_48048']['pass'] += 1
-        else:
-            results['standard_48048']['fail'] += 1
+        status = pass_token if batch.s48048_match[idx] else fail_token
+        out(f"  Standard Method (48048 Hz, truncate): {_thousands(batch.s48048_ref[idx])}")
+        out(f"    Decoded: {format_tc(batch.s48048_decoded[idx])} {status}")
         
-        print()
+        out("")
     
     # Summary
-    print("=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-    print()
+    out("=" * 80)
+    out("SUMMARY")
+    out("=" * 80)
+    out("")
     
+    out(f"Frame Method (48048 Hz, truncate):")
+    out(f"  Passed: {results['frame_method']['pass']}/{total_tests}")
+    out(f"  Failed: {results['frame_method']['fail']}/{total_tests}")
+    out("")
+    
+    out(f"Standard Method (48000 Hz, round):")
+    out(f"  Passed: {results['standard_48k']['pass']}/{total_tests}")
+    out(f"  Failed: {results['standard_48k']['fail']}/{total_tests}")
+    out("")
+    
+    out(f"Standard Method (48048 Hz, truncate):")
+    out(f"  Passed: {results['standard_48048']['pass']}/{total_tests}")
+    out(f"  Failed: {results['standard_48048']['fail']}/{total_tests}")
+    out("")
+    
+    if fail_tests:
+        out("=" * 80)
+        out("FAILURES DETAIL")
+        out("=" * 80)
+        for test, tc, method, decoded in zip(fail_tests, fail_tcs, fail_methods, fail_decoded):
+            out(f"Test {test}: {tc}")
+            out(f"  Method: {method}")
+            out(f"  Decoded as: {decoded}")
+            out("")
+    
+    # Conclusion
+    out("=" * 80)
+    out("CONCLUSION")
+    out("=" * 80)
+    
+    success = results['frame_method']['fail'] == 0
+    if success:
+        out(f"{pass_token}: FRAME METHOD IS CONSISTENT!")
+        out("   Works perfectly for all tested timecodes.")
+    else:
+        out(f"{fail_token}: FRAME METHOD HAS ISSUES")
+        out(f"   Failed {results['frame_method']['fail']} out of {total_tests} tests.")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return success
+
+def run_full_day() -> bool:
+    """Sweep every timecode of the day and print a summary"""
+    test_cases = full_day_cases()
     total_tests = len(test_cases)
+    pass_counts, failures = sweep(test_cases)
     
-    print(f"Frame Method (48048 Hz, truncate):")
-    print(f"  ✅ Passed: {results['frame_method']['pass']}/{total_tests}")
-    print(f"  ❌ Failed: {results['frame_method']['fail']}/{total_tests}")
-    print()
+    lines: List[str] = []
+    out = lines.append
     
-    print(f"Standard Method (48000 Hz, round):")
-    print(f"  ✅ Passed: {results['standard_48k']['pass']}/{total_tests}")
-    print(f"  ❌ Failed: {results['standard_48k']['fail']}/{total_tests}")
-    print()
+    out("=" * 80)
+    out("FRAME-BASED BEXT METHOD - FULL DAY SWEEP")
+    out("=" * 80)
+    out("")
     
-    print(f"Standard Method (48048 Hz, truncate):")
-    print(f"  ✅ Passed: {results['standard_48048']['pass']}/{total_tests}")
-    print(f"  ❌ Failed: {results['standard_48048']['fail']}/{total_tests}")
-    print()
+    for label, passed in zip(("Frame Method (48048 Hz, truncate):",
+                              "Standard Method (48000 Hz, round):",
+                              "Standard Method (48048 Hz, truncate):"), pass_counts):
+        out(label)
+        out(f"  Passed: {passed}/{total_tests}")
+        out(f"  Failed: {total_tests - passed}/{total_tests}")
+        out("")
     
     if failures:
-        print("=" * 80)
-        print("FAILURES DETAIL")
-        print("=" * 80)
-        for fail in failures:
-            print(f"Test {fail['test']}: {fail['timecode']}")
-            print(f"  Method: {fail['method']}")
-            print(f"  Decoded as: {fail['decoded']}")
-            print()
+        out("=" * 80)
+        out("FRAME METHOD FAILURES (first 20)")
+        out("=" * 80)
+        for original, decoded in failures[:20]:
+            out(f"{format_tc(original)} decoded as {format_tc(decoded)}")
+        out("")
     
-    # Conclusion
-    print("=" * 80)
-    print("CONCLUSION")
-    print("=" * 80)
-    
-    if results['frame_method']['fail'] == 0:
-        print("✅ FRAME METHOD IS CONSISTENT!")
-        print("   Works perfectly for all tested timecodes.")
-        return True
-    else:
-        print("⚠️  FRAME METHOD HAS ISSUES")
-        print(f"   Failed {results['frame_method']['fail']} out of {total_tests} tests.")
-        return False
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return not failures
 
 if __name__ == '__main__':
-    success = run_tests()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Test the frame-based BEXT calculation method')
+    parser.add_argument('--full-day', action='store_true',
+                       help='Sweep every timecode of the day (summary only)')
+    
+    args = parser.parse_args()
+    
+    success = run_full_day() if args.full_day else run_tests()
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,157 @@
+//! BEXT TimeReference calculation
+//! Validated frame-based method for 23.976fps (frames × 2004.005263),
+//! computed with exact integer arithmetic.
+//!
+//! Kept in step with `bwf-tools/test_frame_method.py`: both treat
+//! 23.976 and 2004.005263 as exact decimals, so Rust and Python
+//! produce bit-identical TimeReferences.
+
+use rayon::prelude::*;
+
+/// 23.976 fps as an exact fraction (2997/125)
+pub const FRAME_RATE_NUM: u64 = 2997;
+pub const FRAME_RATE_DEN: u64 = 125;
+
+/// 2004.005263 samples per frame as an exact fraction
+pub const SAMPLES_PER_FRAME_NUM: u64 = 2_004_005_263;
+pub const SAMPLES_PER_FRAME_DEN: u64 = 1_000_000;
+
+/// Nominal timecode frames per second at 23.976fps
+const TC_FPS: usize = 24;
+const FRAMES_PER_HOUR: usize = 3600 * TC_FPS;
+
+/// Number of timecodes in a day (00:00:00:00 - 23:59:59:23)
+pub const FRAMES_PER_DAY: usize = 24 * FRAMES_PER_HOUR;
+
+/// Timecode frames scaled by `FRAME_RATE_DEN` (equivalently, seconds scaled
+/// by `FRAME_RATE_NUM`)
+fn scaled_frames(hours: u64, minutes: u64, seconds: u64, frames: u64) -> u128 {
+    let whole_seconds = hours as u128 * 3600 + minutes as u128 * 60 + seconds as u128;
+    whole_seconds * FRAME_RATE_NUM as u128 + frames as u128 * FRAME_RATE_DEN as u128
+}
+
+/// Frame-based TimeReference: total frames × 2004.005263, truncated
+pub fn calculate_frame_based(hours: u64, minutes: u64, seconds: u64, frames: u64) -> u64 {
+    let total_frames_num = scaled_frames(hours, minutes, seconds, frames);
+    (total_frames_num * SAMPLES_PER_FRAME_NUM as u128
+        / (FRAME_RATE_DEN as u128 * SAMPLES_PER_FRAME_DEN as u128)) as u64
+}
+
+/// Standard time-based TimeReference: total seconds × sample rate, truncated
+pub fn calculate_standard(hours: u64, minutes: u64, seconds: u64, frames: u64, sample_rate: u64) -> u64 {
+    let total_seconds_num = scaled_frames(hours, minutes, seconds, frames);
+    (total_seconds_num * sample_rate as u128 / FRAME_RATE_NUM as u128) as u64
+}
+
+/// Split a TimeReference into (hours, minutes, seconds, leftover samples)
+fn split_samples(time_ref: u64, sample_rate: u64) -> (u64, u64, u64, u64) {
+    let (total_seconds, sub_samples) = (time_ref / sample_rate, time_ref % sample_rate);
+    let (total_minutes, seconds) = (total_seconds / 60, total_seconds % 60);
+    (total_minutes / 60, total_minutes % 60, seconds, sub_samples)
+}
+
+/// Decode a TimeReference to (h, m, s, f) at 23.976fps using truncation
+pub fn verify_truncate(time_ref: u64, sample_rate: u64) -> (u64, u64, u64, u64) {
+    let (h, m, s, sub_samples) = split_samples(time_ref, sample_rate);
+    let f = sub_samples as u128 * FRAME_RATE_NUM as u128 / (sample_rate as u128 * FRAME_RATE_DEN as u128);
+    (h, m, s, f as u64)
+}
+
+/// Decode a TimeReference to (h, m, s, f) at 23.976fps using rounding
+/// (half to even, like Python's `round`)
+pub fn verify_round(time_ref: u64, sample_rate: u64) -> (u64, u64, u64, u64) {
+    let (h, m, s, sub_samples) = split_samples(time_ref, sample_rate);
+    let n = sub_samples as u128 * FRAME_RATE_NUM as u128;
+    let d = sample_rate as u128 * FRAME_RATE_DEN as u128;
+    let (mut f, r) = (n / d, n % d);
+    if 2 * r > d || (2 * r == d && f % 2 == 1) {
+        f += 1;
+    }
+    (h, m, s, f as u64)
+}
+
+/// Frame-based TimeReference for every timecode of the day, indexed by
+/// timecode frame number. Hours are computed in parallel, one chunk each.
+pub fn sweep_day() -> Vec<u64> {
+    let mut out = vec![0u64; FRAMES_PER_DAY];
+    out.par_chunks_mut(FRAMES_PER_HOUR)
+        .enumerate()
+        .for_each(|(hours, hour)| {
+            for (idx, slot) in hour.iter_mut().enumerate() {
+                let (minutes, rem) = (idx / (60 * TC_FPS), idx % (60 * TC_FPS));
+                let (seconds, frames) = (rem / TC_FPS, rem % TC_FPS);
+                *slot = calculate_frame_based(hours as u64, minutes as u64, seconds as u64, frames as u64);
+            }
+        });
+    out
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Values produced by bwf-tools/test_frame_method.py
+    const PYTHON_CASES: &[((u64, u64, u64, u64), u64, u64, u64)] = &[
+        // (timecode, frame-based, standard 48000, standard 48048)
+        ((13, 20, 20, 5), 2307276429, 2304970010, 2307274980),
+        ((0, 0, 0, 0), 0, 0, 0),
+        ((1, 0, 0, 0), 172972908, 172800000, 172972800),
+        ((23, 59, 59, 23), 4151347852, 4147198046, 4151345244),
+        ((10, 30, 15, 10), 1816956301, 1815140020, 1816955160),
+        ((1, 2, 3, 23), 178928908, 178750046, 178928796),
+        ((0, 0, 0, 1), 2004, 2002, 2004),
+    ];
+
+    #[test]
+    fn test_matches_python() {
+        for &((h, m, s, f), frame_based, std_48k, std_48048) in PYTHON_CASES {
+            assert_eq!(calculate_frame_based(h, m, s, f), frame_based);
+            assert_eq!(calculate_standard(h, m, s, f, 48000), std_48k);
+            assert_eq!(calculate_standard(h, m, s, f, 48048), std_48048);
+        }
+    }
+
+    #[test]
+    fn test_decode() {
+        assert_eq!(verify_truncate(2307276429, 48048), (13, 20, 20, 5));
+        assert_eq!(verify_truncate(4151347852, 48048), (24, 0, 0, 0));
+        assert_eq!(verify_truncate(2004, 48048), (0, 0, 0, 0));
+        assert_eq!(verify_round(2304970010, 48000), (13, 20, 20, 5));
+        assert_eq!(verify_round(2002, 48000), (0, 0, 0, 1));
+    }
+
+    #[test]
+    fn test_sweep_day() {
+        let day = sweep_day();
+        assert_eq!(day.len(), FRAMES_PER_DAY);
+        for &((h, m, s, f), frame_based, _, _) in PYTHON_CASES {
+            if h < 24 {
+                let idx = ((h * 60 + m) * 60 + s) as usize * TC_FPS + f as usize;
+                assert_eq!(day[idx], frame_based);
+            }
+        }
+        assert!(day.windows(2).all(|w| w[0] < w[1]));
+    }
+
+    #[test]
+    fn test_matches_float_formula_full_day() {
+        // The previous f64 formula, for every timecode of the day
+        const FRAME_RATE: f64 = 23.976;
+        const MULTIPLIER: f64 = 2004.005263;
+
+        for h in 0..24u64 {
+            for m in 0..60u64 {
+                for s in 0..60u64 {
+                    for f in 0..24u64 {
+                        let total_frames = (h as f64 * 60.0 * 60.0 * FRAME_RATE)
+                            + (m as f64 * 60.0 * FRAME_RATE)
+                            + (s as f64 * FRAME_RATE)
+                            + f as f64;
+                        let expected = (total_frames * MULTIPLIER) as u64;
+                        assert_eq!(calculate_frame_based(h, m, s, f), expected);
+                    }
+                }
+            }
+        }
+    }
+}
@@ -4,6 +4,7 @@
 //! Supports macOS, Windows, and Linux
 
 pub mod ale;
+pub mod bext;
 pub mod config;
 pub mod error;
 pub mod job;
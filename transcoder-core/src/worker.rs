@@ -351,15 +351,7 @@ impl WorkerPool {
             let frames: u64 = tc_parts[3].parse().unwrap_or(0);
             
             // Validated frame-based formula for 23.976fps @ 48000 Hz
-            const FRAME_RATE: f64 = 23.976;
-            const MULTIPLIER: f64 = 2004.005263;
-            
-            let total_frames = (hours as f64 * 60.0 * 60.0 * FRAME_RATE)
-                + (minutes as f64 * 60.0 * FRAME_RATE)
-                + (seconds as f64 * FRAME_RATE)
-                + frames as f64;
-            
-            let time_reference = (total_frames * MULTIPLIER) as u64;
+            let time_reference = crate::bext::calculate_frame_based(hours, minutes, seconds, frames);
             
             info!("Calculated TimeReference: {} for timecode: {}", time_reference, timecode);
             